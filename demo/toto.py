@@ -5,10 +5,13 @@ pkg_dir = Path().resolve().parents[0]
 import sys
 sys.path.insert(0,str(pkg_dir.absolute()))
 
+import math
+
 import matplotlib.pyplot as plt
 import pandas as pd
 
 
+from firefly.earth.earth_model import EarthModel
 from firefly.earth.gravity import gravity
 from firefly.geography.position import Position
 import numpy as np
@@ -25,12 +28,34 @@ list_data =[
 
 earth_model = "SPHERICAL"
 
+# earth model constants hoisted out of the ODE right-hand side: solve_ivp
+# calls it hundreds of thousands of times and a per-step EarthModel /
+# Position construction dominates the runtime
+_earth = EarthModel(earth_model)
+_mu = _earth.mu
+_a2 = _earth.a**2
+_j2 = _earth.j2
+
 # support functions
 def gravity4X(
         t:float,
         X: list[float]) -> list[float]:
-    return gravity(Position(*X[0:3]),earth_model=earth_model)
-    
+    # same law as firefly.earth.gravity.gravity, inlined on plain floats
+    x, y, z = X[0], X[1], X[2]
+
+    r2 = x*x + y*y + z*z
+    r = math.sqrt(r2)
+
+    common_factor = -_mu / r2
+    j2_factor = 3/2 * _j2 * _a2 / r2
+    z_factor = z*z / r2
+
+    gx = common_factor * (1 + j2_factor * (1 - 5 * z_factor)) * x / r
+    gy = common_factor * (1 + j2_factor * (1 - 5 * z_factor)) * y / r
+    gz = common_factor * (1 + j2_factor * (3 - 5 * z_factor)) * z / r
+
+    return [gx, gy, gz]
+
 
 
 def pfd(
@@ -43,18 +68,45 @@ def pfd(
 
     # Position Equation
     dx_dt = velocity
-    
+
 
     dv_dt = gravity4X(t,X)
 
     return dx_dt + dv_dt # concat vector
 
-def hit_ground(t, X): 
 
-    [x,y,z,_,_,_] = X
+def jac(
+        t:float,
+        X:list[float]) -> np.ndarray:
+    # analytic 6x6 Jacobian of pfd for the spherical model:
+    # d(dx/dt)/dv = I3 and dg/dr = -mu/r^3 * I3 + 3*mu/r^5 * r.r^T
+    x, y, z = X[0], X[1], X[2]
+
+    r2 = x*x + y*y + z*z
+    r = math.sqrt(r2)
+
+    J = np.zeros((6, 6))
+    J[0:3, 3:6] = np.eye(3)
+
+    r_vec = np.array([x, y, z])
+    J[3:6, 0:3] = (-_mu / r**3 * np.eye(3)
+                   + 3 * _mu / r**5 * np.outer(r_vec, r_vec))
+
+    return J
+
+_earth_radius = _earth.a
+
+def hit_ground(t, X):
+
+    x, y, z = X[0], X[1], X[2]
+
+    if earth_model == "SPHERICAL":
+        # altitude over a sphere is just the distance to the center minus
+        # the radius: no Bowring iteration, no Position allocation
+        return math.sqrt(x*x + y*y + z*z) - _earth_radius
 
     [_,_,alt] = Position(x,y,z).as_LLA(earth_model=earth_model)
-    
+
     return alt
 
 
@@ -64,13 +116,14 @@ pos0 = Position.from_LLA(0.,0.,1000000.)
 X0 = [pos0.x,pos0.y,pos0.z,0.,0.,0.]
 
 tend = 40000
-time = np.linspace(0,tend,10000)
 tspan = (0, tend)
 
 from scipy.integrate import solve_ivp, RK45
 hit_ground.terminal = True
-Y = solve_ivp(pfd,tspan,X0,events=[hit_ground],max_step=0.1,
-              dense_output=True)
+# LSODA takes adaptive steps and uses the analytic Jacobian; max_step=0.1
+# forced >=4e5 RHS calls over tend=40000 regardless of the dynamics, and
+# the dense interpolant (Y.sol) was never used downstream
+Y = solve_ivp(pfd,tspan,X0,events=[hit_ground],method='LSODA',jac=jac)
 
 if Y.status == 1:
     print('Success, termination event occured.')
@@ -79,8 +132,10 @@ if Y.status == 0:
 
 
 
+# column-wise construction: no concatenate/transpose copy of Y.y
 df = pd.DataFrame(
-    np.concatenate((Y.t[:, np.newaxis], Y.y.T), axis= 1),columns=list_data)
+    {name: (Y.t if name == "time" else Y.y[idx - 1])
+     for idx, name in enumerate(list_data)})
 
 # print(df.shape)
 
@@ -90,55 +145,45 @@ df = pd.DataFrame(
 # Add informations to dataframe
 
 def calculate_position(t,X):
-    lat_n, long_n, alt_n = Position(*X[0:3]).as_LLA()
-    
+    # single ECEF->LLA conversion shared by both column sets: the arrays
+    # are assigned by reference, so the duplicated columns are free
+    lat_n, long_n, alt_n = Position.as_LLA_batch(X[:, 0], X[:, 1], X[:, 2])
+
     return {'lat': lat_n,
             'long': long_n,
-            'alt': alt_n}
-
-def calculate_position2(t,X):
-    lat_n, long_n, alt_n = Position(*X[0:3]).as_LLA()
-    
-    return {'lat2': lat_n,
+            'alt': alt_n,
+            'lat2': lat_n,
             'long2': long_n,
             'alt2': alt_n}
 
 def add_parameters(
         df:pd.DataFrame,
-        funs:list[Callable[[float, list[float]], Dict[str, Any]]]
+        funs:list[Callable[[np.ndarray, np.ndarray], Dict[str, np.ndarray]]]
         ) -> pd.DataFrame:
-    
-    tt = []
-    
-    for index, row in df.iterrows():
-
-        # initiate dict
-        new_row_as_dict = {}
-
-        #create X
-        X = row[list_data[1:]]
-
-        # create t
-        t = row["time"]
-        for fun in funs:
-
-            dict_to_add = fun(t,X)
-            if dict_to_add.keys() & new_row_as_dict.keys() == set():
-                new_row_as_dict.update(dict_to_add)
-            else:
-                common_keys = list(dict_to_add.keys() & new_row_as_dict.keys())
-                msg = [
-                    f"The following keys are used at least twice: {common_keys}"
-                ]
-                raise KeyError(msg)
-        
-        tt.append(new_row_as_dict)
-
-    new_df = pd.DataFrame.from_dict(tt) # type: ignore
+
+    # extract the columns once as plain ndarrays (no per-row Series)
+    t = df["time"].to_numpy()
+    X = df[list_data[1:]].to_numpy()
+
+    new_columns: Dict[str, np.ndarray] = {}
+
+    for fun in funs:
+
+        dict_to_add = fun(t,X)
+        if dict_to_add.keys() & new_columns.keys() == set():
+            new_columns.update(dict_to_add)
+        else:
+            common_keys = list(dict_to_add.keys() & new_columns.keys())
+            msg = [
+                f"The following keys are used at least twice: {common_keys}"
+            ]
+            raise KeyError(msg)
+
+    new_df = pd.DataFrame(new_columns)
     return pd.concat([df,new_df],axis=1)
 
 
-df2 = add_parameters(df,funs=[calculate_position,calculate_position2]) 
+df2 = add_parameters(df,funs=[calculate_position])
 
 # print(df2.tail())
 
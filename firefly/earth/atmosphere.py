@@ -15,11 +15,12 @@ __all__ = [
 # ================================ IMPORTS ================================= #
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import NamedTuple
 import warnings
 
 import numpy as np
-from firefly.earth.earth_model import EarthModel
+from firefly.earth.earth_model import get_earth_model
 from firefly.math.array import is_strictly_monotonic_increasing
 
 from firefly.types import Float641DVector
@@ -137,20 +138,24 @@ class Atmosphere(ABC):
         Raises:
             None
         """
+        x = float(x)
+
+        if len(xlevels) == 0:
+            raise ValueError("Xlevels must not be empty.")
+
         if not is_strictly_monotonic_increasing(xlevels):
             raise ValueError(
                 ("Xlevels must be strictly monotonic increasing.\n"
                  f"Got : {xlevels}"))
 
-        if x <= xlevels[0]:
+        # single binary search: side='right' maps an exact match to its
+        # own index and an interior value to the level below, so the
+        # equality scan and the boundary branches collapse to a clamp
+        index = int(np.searchsorted(xlevels, x, side='right')) - 1
+
+        if index < 0:
             return 0
-        elif x > xlevels[-1]:
-            return len(xlevels) - 1
-        elif x in xlevels:
-            index = np.where(xlevels==x)
-            return int(index[0][0])
-        else:
-            return int(np.searchsorted(xlevels, x, side='left')) - 1
+        return min(index, len(xlevels) - 1)
 
     @property
     @abstractmethod
@@ -228,89 +233,278 @@ class USSA76(Atmosphere):
     __max_altitude = 86000 # m geopotential altitude
     __gamma = 1.4 # ratio of specific heats
     __P0 = 101325.0 # Pa
-    __r_earth = EarthModel("WGS84").mean_radius # km mean radius for WGS84
+    __r_earth = get_earth_model("WGS84").mean_radius # m mean radius for WGS84
+
+    # per-layer constants derived once at class definition: the batch
+    # evaluator gathers them by layer index instead of redoing the
+    # divisions for every point
+    _alpha = -__g0 * __M0 / __R
+    _m_air = __R / __M0
+    _isothermal = __gtab == 0.0
+    _alpha_over_tgrad = np.where(
+        _isothermal, 0.0, _alpha / np.where(_isothermal, 1.0, __gtab))
+    _alpha_over_tbase = _alpha / __ttab
+
+    # mutually exclusive pressure coefficients: exactly one of the two
+    # is nonzero per layer, so pressure factors into a single
+    # exp(k_iso*deltah + k_poly*log(T/tbase)) with no selection branch
+    _k_iso = np.where(_isothermal, _alpha_over_tbase, 0.0)
+    _k_poly = _alpha_over_tgrad
+
+    # resolution of the uniform altitude lookup table built at construction
+    _LUT_SIZE = 10000
+
+    # resolution of the layer-index bucket table (O(1) layer search)
+    _LAYER_LUT_SIZE = 1024
+
+    # prebuilt lookup table shipped next to the module; memory-mapped at
+    # construction so the pages are shared across processes
+    _LUT_PATH = Path(__file__).with_name("ussa76_lut_v1.npy")
 
     def __init__(
         self,
         with_warnings: bool = True) -> None:
         self.__with_warnings = with_warnings
+        # plain-float copies bound once: `current_parameters` checks them
+        # directly instead of going through validate_altitude dispatch
+        self._max_alt = float(self.__max_altitude)
+        self._warn = bool(with_warnings)
+        self.__build_layer_lut()
+        self.__build_lut()
         super().__init__()
 
+    def __build_layer_lut(self) -> None:
+        """
+        Precompute a bucket table mapping geopotential altitude to layer
+        index.
+
+        The layer of a point is then one multiply, one load and one
+        comparison (a bucket can straddle a layer boundary, so the
+        gathered index is corrected against the upper bound of its
+        layer) instead of a binary search.
+        """
+        h_max = self._geometric_to_geopotential_altitude(
+            altitude=float(self.__max_altitude),
+            r_earth=self.__r_earth)
+
+        buckets = np.linspace(0.0, h_max, self._LAYER_LUT_SIZE)
+
+        self.__layer_lut = np.clip(
+            np.searchsorted(self.__htab, buckets, side='right') - 1,
+            0, len(self.__htab) - 1).astype(np.intp)
+        self.__layer_lut_inv_step = (self._LAYER_LUT_SIZE - 1) / h_max
+
+        # upper bound of each layer, +inf for the last one
+        self.__htab_upper = np.append(self.__htab[1:], np.inf)
+
     @property
     def max_altitude(self) -> float:
         return self.__max_altitude
 
-    def current_parameters(
+    def current_parameters_batch(
         self,
-        altitude:float,
-        ) -> CurrentAtmosphericParameters:
+        altitudes: Float641DVector,
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calculate the current atmospheric parameters at the given geometric altitude.
+        Calculate the atmospheric parameters for an array of geometric
+        altitudes in one vectorized pass.
+
+        The layered USSA76 formulas are evaluated exactly (no table
+        interpolation): one searchsorted gives the layer index of every
+        point and np.where blends the isothermal and gradient layers
+        without a Python-level branch. Altitudes above the model maximum
+        yield zeros, as in the scalar API (no warning is emitted).
 
         Args:
-            altitude (float): The geometric altitude in meters.
+            altitudes (np.ndarray): The geometric altitudes in meters.
 
         Returns:
-            CurrentAtmosphericParameters: An object containing the current
-            atmospheric parameters including temperature, pressure, density, and speed of sound.
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the
+            temperatures, pressures, densities and speeds of sound.
 
         Raises:
-            None
+            ValueError: If any altitude is negative.
         """
+        altitudes = np.asarray(altitudes, dtype=np.float64)
 
-        altitude_geometric = self.validate_altitude(altitude)
-
-        if altitude_geometric > self.max_altitude:
-            return CurrentAtmosphericParameters(
-                temperature=0,
-                pressure=0,
-                density=0,
-                speed_of_sound=0,
-                )
-
-        # convert geometric altitude to geopotential altitude
-        altitude = self._geometric_to_geopotential_altitude(
-             altitude=altitude_geometric,
-             r_earth=self.__r_earth)
-
-        # Get the index of the closest value in xlevels to x.
-        layer_index = self.get_index(altitude, self.__htab)
+        if np.any(altitudes < 0):
+            raise ValueError(
+                f"Geometric Altitude must be positive, got {altitudes}"
+            )
 
-        # Get the properties of the local layer
-        tgrad = self.__gtab[layer_index]		# temp. gradient of local layer
-        tbase = self.__ttab[layer_index]		# base  temp. of local layer
-        pbase = self.__ptab[layer_index]		# base  pressure of local layer
-        deltah = altitude-self.__htab[layer_index]	# height above local base
+        # convert geometric altitudes to geopotential altitudes
+        h = self._geometric_to_geopotential_altitude(
+            altitude=altitudes,
+            r_earth=self.__r_earth)
+
+        # O(1) layer index of every point: bucket lookup plus a one-step
+        # correction where a bucket straddles a layer boundary
+        bucket = np.minimum(
+            (h * self.__layer_lut_inv_step).astype(np.intp),
+            self._LAYER_LUT_SIZE - 1)
+        layer_index = self.__layer_lut[bucket]
+        layer_index = layer_index + (h >= self.__htab_upper[layer_index])
+
+        # Get the properties of the local layers
+        tgrad = self.__gtab[layer_index]	# temp. gradient of local layer
+        tbase = self.__ttab[layer_index]	# base  temp. of local layer
+        pbase = self.__ptab[layer_index]	# base  pressure of local layer
+        deltah = h - self.__htab[layer_index]	# height above local base
 
         # Calculate temperature
         temperature = tbase + tgrad * deltah	# local temperature
 
-        # Calculate pressure
-        alpha = -self.__g0 *self.__M0 / (self.__R)
+        # R/M_air, precomputed at class definition
+        m_air = self._m_air
 
-        # calulate R/M_air
-        m_air = self.__R/self.__M0
-
-        if tgrad == 0.:  # isothermal layer
-            pressure = pbase * np.exp(alpha / tbase * deltah)
-        else: # non-isothermal layer
-            pressure = pbase * \
-                           (temperature / tbase) ** \
-                           (alpha / tgrad)
+        # branchless pressure: per layer exactly one of k_iso/k_poly is
+        # nonzero, so the isothermal and gradient formulas collapse into
+        # one exp (T == tbase on isothermal layers, so the log term
+        # vanishes there)
+        pressure = pbase * np.exp(
+            self._k_iso[layer_index] * deltah
+            + self._k_poly[layer_index] * np.log(temperature / tbase))
 
         # Calculate density
         density = pressure / (m_air * temperature)
 
         # calculate speed of sound
-        a = np.sqrt(self.__gamma * m_air * temperature)
+        speed_of_sound = np.sqrt(self.__gamma * m_air * temperature)
+
+        # altitudes above the model: all parameters drop to zero
+        above_max = altitudes > self.__max_altitude
+        if np.any(above_max):
+            temperature = np.where(above_max, 0., temperature)
+            pressure = np.where(above_max, 0., pressure)
+            density = np.where(above_max, 0., density)
+            speed_of_sound = np.where(above_max, 0., speed_of_sound)
+
+        return temperature, pressure, density, speed_of_sound
+
+    def __build_lut(self) -> None:
+        """
+        Precompute a uniform lookup table of the atmospheric parameters.
+
+        The layered USSA76 formulas are evaluated once, vectorized, on a
+        fine uniform grid of geometric altitudes; `current_parameters`
+        then serves each call with an O(1) indexed linear interpolation
+        instead of a layer search plus transcendental functions.
+        """
+        lut = self.__load_lut()
+
+        if lut is None:
+            altitudes = np.linspace(0.0, float(self.__max_altitude),
+                                    self._LUT_SIZE)
+            lut = np.stack(self.current_parameters_batch(altitudes))
+            try:
+                np.save(self._LUT_PATH, lut)
+            except OSError:
+                pass  # read-only install: keep the in-memory table
+
+        self.__lut_temperature = lut[0]
+        self.__lut_pressure = lut[1]
+        self.__lut_density = lut[2]
+        self.__lut_speed_of_sound = lut[3]
+        self.__lut_inv_step = (self._LUT_SIZE - 1) / float(self.__max_altitude)
+
+    def __load_lut(self) -> np.ndarray | None:
+        """
+        Memory-map the prebuilt lookup table if it is usable.
+
+        The file is validated against the expected shape and the
+        sea-level temperature of the class tables, so a stale table from
+        an older model revision falls back to in-memory regeneration.
+
+        Returns:
+            np.ndarray | None: the memory-mapped (4, _LUT_SIZE) table,
+            or None if the file is missing or does not match.
+        """
+        if not self._LUT_PATH.is_file():
+            return None
+        try:
+            lut = np.load(self._LUT_PATH, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        if lut.shape != (4, self._LUT_SIZE) or lut[0, 0] != self.__ttab[0]:
+            return None
+        return lut
+
+    def _current_raw(
+        self,
+        altitude: float,
+        ) -> tuple[float, float, float, float]:
+        """
+        Calculate the current atmospheric parameters as a bare tuple.
+
+        Fast path for integration loops: identical to
+        `current_parameters` but skips the NamedTuple allocation on
+        every call.
+
+        Args:
+            altitude (float): The geometric altitude in meters.
+
+        Returns:
+            tuple[float, float, float, float]: temperature, pressure,
+            density and speed of sound.
+        """
 
-        return CurrentAtmosphericParameters(
-            temperature=temperature,
-            pressure=pressure,
-            density=density,
-            speed_of_sound=a,
+        # validation inlined from validate_altitude: no method dispatch
+        # nor property call on the hot path
+        if altitude < 0:
+            raise ValueError(
+                f"Geometric Altitude must be positive, got {altitude}"
             )
 
+        if altitude > self._max_alt:
+            if self._warn:
+                warnings.warn(
+                    f"Altitude should be less than {self.max_altitude}m,"
+                    f" got {altitude}m. "
+                    "Please consider using a different atmosphere model."
+                )
+            return (0., 0., 0., 0.)
+
+        # O(1) fractional index into the uniform table
+        u = altitude * self.__lut_inv_step
+        index = min(int(u), self._LUT_SIZE - 2)
+        weight = u - index
+
+        lut_t = self.__lut_temperature
+        lut_p = self.__lut_pressure
+        lut_d = self.__lut_density
+        lut_a = self.__lut_speed_of_sound
+
+        return (
+            lut_t[index] + weight * (lut_t[index+1] - lut_t[index]),
+            lut_p[index] + weight * (lut_p[index+1] - lut_p[index]),
+            lut_d[index] + weight * (lut_d[index+1] - lut_d[index]),
+            lut_a[index] + weight * (lut_a[index+1] - lut_a[index]),
+            )
+
+    def current_parameters(
+        self,
+        altitude:float,
+        ) -> CurrentAtmosphericParameters:
+        """
+        Calculate the current atmospheric parameters at the given geometric altitude.
+
+        The parameters are interpolated from the table precomputed at
+        construction, so a call costs one index computation and four
+        linear interpolations.
+
+        Args:
+            altitude (float): The geometric altitude in meters.
+
+        Returns:
+            CurrentAtmosphericParameters: An object containing the current
+            atmospheric parameters including temperature, pressure, density, and speed of sound.
+
+        Raises:
+            None
+        """
+
+        return CurrentAtmosphericParameters(*self._current_raw(altitude))
+
     def validate_altitude(self, altitude2validate: float) -> float:
 
         altitude2validate = self._invalidate_negative_altitude(
@@ -1,12 +1,14 @@
 # IMPORTED MODULES
+from dataclasses import dataclass
+import functools
 import math
-from pydantic import BaseModel, ConfigDict
 
 from firefly.settings import DEFAULT_EARTH_MODEL
 from firefly.types import EllipsoidParameters
 
 __all__ = [
     "EarthModel",
+    "get_earth_model",
 ]
 
 # ------------------------  EARTH MODELS  ------------------------
@@ -35,23 +37,26 @@ AVAILABLE_ELLIPSOIDS = {
     }
 
 
-class EarthModel(BaseModel):
+DEFAULT_MU = 3.986004418E14  # m-3s-2
+
+
+@dataclass(frozen=True, slots=True)
+class EarthModel:
     """Earth Model Class used to model the Earth Ellipsoid and associated
     characteristic
+
+    The values always come from the curated AVAILABLE_ELLIPSOIDS table,
+    so a plain frozen dataclass is enough: no per-construction pydantic
+    validation on the hot paths.
     """
     name: str
     semiMajorAxis: float
     flattening: float
     j2: float
     earth_rotation_rate: float # rotation rate rad/s
-    mu: float = 3.986004418E14  # m-3s-2
-
-    # -------------------------- CONFIGURATION ------------------------- #
-    model_config = ConfigDict(
-        extra='forbid',
-        validate_assignment=True,
-        frozen=True,
-        )
+    mu: float = DEFAULT_MU
+    b: float = 0.0 # semi minor axis (m), derived at construction
+    e: float = 0.0 # excentricity (SI), derived at construction
 
     # ----------------------------- CREATOR ---------------------------- #
 
@@ -69,7 +74,18 @@ class EarthModel(BaseModel):
                 f"Available models: {list(AVAILABLE_ELLIPSOIDS.keys())}"
                 )
             raise ValueError(msg)
-        super().__init__(**earth_model._asdict())
+
+        # derived scalars are computed once here: the model is frozen, so
+        # they never go stale and hot loops avoid recomputing them
+        a = earth_model.semiMajorAxis
+        b = (1 - earth_model.flattening) * a
+        e = math.sqrt((a**2 - b**2) / a**2)
+
+        for field_name, value in earth_model._asdict().items():
+            object.__setattr__(self, field_name, value)
+        object.__setattr__(self, "mu", DEFAULT_MU)
+        object.__setattr__(self, "b", b)
+        object.__setattr__(self, "e", e)
 
     # --------------------------- PROPERTIES --------------------------- #
     @property
@@ -91,28 +107,27 @@ class EarthModel(BaseModel):
         return self.flattening
 
     @property
-    def b(self) -> float:
-        """Semi minor acis of the ellispoid in meters
+    def mean_radius(self) -> float:
+        """Mean radius of the ellispoid
 
         Returns:
-            float: Semi minor acis of the ellispoid in meters
+            float: Mean radius of the ellispoid (SI)
         """
-        return (1-self.f)*self.a
+        return (2*self.a+self.b)/3
 
-    @property
-    def e(self) -> float:
-        """Excentricity of the ellispoid
 
-        Returns:
-            float: Excentricity of the ellispoid (SI)
-        """
-        return math.sqrt((self.a**2-self.b**2)/self.a**2)
+@functools.lru_cache(maxsize=len(AVAILABLE_ELLIPSOIDS))
+def get_earth_model(model: str = DEFAULT_EARTH_MODEL) -> EarthModel:
+    """Return a cached Earth Model Object
 
-    @property
-    def mean_radius(self) -> float:
-        """Mean radius of the ellispoid
+    The model is frozen, so the same instance can be shared by all the
+    callers: hot paths (gravity, ECEF/LLA conversions) avoid rebuilding
+    a pydantic object per call.
 
-        Returns:
-            float: Mean radius of the ellispoid (SI)
-        """
-        return (2*self.a+self.b)/3
\ No newline at end of file
+    Args:
+        model (str, optional): ellipsoid model name. Defaults to WGS84.
+
+    Returns:
+        EarthModel: the cached Earth Model instance
+    """
+    return EarthModel(model)
\ No newline at end of file
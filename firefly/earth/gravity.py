@@ -8,12 +8,60 @@
 # EXPORT
 __all__ = [
     "gravity",
+    "gravity_many",
+    "gravity_soa",
 ]
 
+import math
+
+import numpy as np
+
 from firefly.geography.position import Position
-from firefly.earth.earth_model import EarthModel
+from firefly.earth.earth_model import get_earth_model
 from firefly.settings import DEFAULT_EARTH_MODEL
 
+
+def _gravity_kernel(
+        x: float,
+        y: float,
+        z: float,
+        a: float,
+        mu: float,
+        j2: float) -> tuple[float, float, float]:
+    """scalar gravity kernel working on plain floats
+
+    One square root and one division feed the whole computation
+    (reciprocals are reused instead of dividing per component), and the
+    shared J2 subexpression is computed once.
+
+    Args:
+        x (float): x coordinate in ECEF (meters)
+        y (float): y coordinate in ECEF (meters)
+        z (float): z coordinate in ECEF (meters)
+        a (float): semi major axis of the ellipsoid (meters)
+        mu (float): gravitational parameter (m3/s2)
+        j2 (float): second gravitational constant (SI)
+
+    Returns:
+        tuple[float, float, float]: the gravitational acceleration
+            components [gx, gy, gz] in meters per second squared.
+    """
+    r2 = x*x + y*y + z*z
+    inv_r = 1.0 / math.sqrt(r2)
+    inv_r2 = inv_r * inv_r
+
+    z_over_r = z * inv_r
+    z_factor = z_over_r * z_over_r
+
+    common_factor = -mu * inv_r2
+    j2_factor = 1.5 * j2 * (a * a * inv_r2)
+
+    k1 = common_factor * (1 + j2_factor * (1 - 5 * z_factor))
+    k2 = common_factor * (1 + j2_factor * (3 - 5 * z_factor))
+
+    return k1 * x * inv_r, k1 * y * inv_r, k2 * z * inv_r
+
+
 def gravity(
         position: Position,
         earth_model: str = DEFAULT_EARTH_MODEL) -> list[float]:
@@ -38,23 +86,135 @@ def gravity(
 
 
     # get gravitation parameter
-    earth = EarthModel(earth_model)
+    earth = get_earth_model(earth_model)
+
+    return list(_gravity_kernel(
+        position.x, position.y, position.z,
+        earth.a, earth.mu, earth.j2))
+
+
+def gravity_many(
+        xyz: np.ndarray,
+        earth_model: str = DEFAULT_EARTH_MODEL,
+        out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Calculate the gravitational acceleration for many positions at once.
+
+    The same law as `gravity`, evaluated with NumPy over an (N, 3) array
+    of ECEF coordinates: the earth-model constants are loaded once and
+    every elementary operation runs vectorized over the N positions.
+
+    Args:
+        xyz (np.ndarray): ECEF positions, shape (N, 3), in meters.
+        earth_model (str, optional): The Earth model to use for the
+            calculation. Defaults to DEFAULT_EARTH_MODEL.
+        out (np.ndarray, optional): Preallocated (N, 3) output array to
+            avoid a per-call allocation. Defaults to None.
+
+    Returns:
+        np.ndarray: The gravitational acceleration vectors, shape (N, 3),
+            in meters per second squared.
+    """
+
+    # get gravitation parameter
+    earth = get_earth_model(earth_model)
+
+    # get constant
+    a = earth.a
+    mu = earth.mu
+    j2 = earth.j2
+
+    xyz = np.asarray(xyz, dtype=np.float64)
+    x = xyz[:, 0]
+    y = xyz[:, 1]
+    z = xyz[:, 2]
+
+    r2 = x*x + y*y + z*z
+    inv_r = 1.0 / np.sqrt(r2)
+    inv_r2 = inv_r * inv_r
+
+    z_over_r = z * inv_r
+    z_factor = z_over_r * z_over_r
+
+    common_factor = -mu * inv_r2
+    j2_factor = 1.5 * j2 * (a * a * inv_r2)
+
+    k1 = common_factor * (1 + j2_factor * (1 - 5 * z_factor))
+    k2 = common_factor * (1 + j2_factor * (3 - 5 * z_factor))
+
+    if out is None:
+        out = np.empty_like(xyz)
+
+    out[:, 0] = k1 * x * inv_r
+    out[:, 1] = k1 * y * inv_r
+    out[:, 2] = k2 * z * inv_r
+
+    return out
+
+
+def gravity_soa(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        zs: np.ndarray,
+        earth_model: str = DEFAULT_EARTH_MODEL,
+        out: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the gravitational acceleration on structure-of-arrays
+    coordinates.
+
+    Same law as `gravity_many` but on three separate contiguous
+    coordinate arrays (the layout of
+    `firefly.geography.position.PositionArray`), so every elementary
+    operation is a unit-stride ufunc pass.
+
+    Args:
+        xs (np.ndarray): x coordinates in ECEF, shape (N,), in meters.
+        ys (np.ndarray): y coordinates in ECEF, shape (N,), in meters.
+        zs (np.ndarray): z coordinates in ECEF, shape (N,), in meters.
+        earth_model (str, optional): The Earth model to use for the
+            calculation. Defaults to DEFAULT_EARTH_MODEL.
+        out (tuple of np.ndarray, optional): Preallocated (gx, gy, gz)
+            output arrays to avoid per-call allocations.
+            Defaults to None.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: the gravitational
+            acceleration components (gx, gy, gz) in meters per second
+            squared.
+    """
+
+    # get gravitation parameter
+    earth = get_earth_model(earth_model)
 
     # get constant
     a = earth.a
     mu = earth.mu
     j2 = earth.j2
 
-    # get norm of ECEF coordinate
-    r = position.norm
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    zs = np.asarray(zs, dtype=np.float64)
+
+    r2 = xs*xs + ys*ys + zs*zs
+    inv_r = 1.0 / np.sqrt(r2)
+    inv_r2 = inv_r * inv_r
+
+    z_over_r = zs * inv_r
+    z_factor = z_over_r * z_over_r
+
+    common_factor = -mu * inv_r2
+    j2_factor = 1.5 * j2 * (a * a * inv_r2)
+
+    k1 = common_factor * (1 + j2_factor * (1 - 5 * z_factor))
+    k2 = common_factor * (1 + j2_factor * (3 - 5 * z_factor))
 
-    # Common factors in the gravity components
-    common_factor = -mu / r**2
-    j2_factor = 3/2 * j2 * (a/r)**2
-    z_factor = (position.z/r)**2
+    if out is None:
+        out = (np.empty_like(xs), np.empty_like(ys), np.empty_like(zs))
 
-    gx = common_factor * (1 + j2_factor * (1 - 5 * z_factor)) * position.x / r
-    gy = common_factor * (1 + j2_factor * (1 - 5 * z_factor)) * position.y / r
-    gz = common_factor * (1 + j2_factor * (3 - 5 * z_factor)) * position.z / r
+    gx, gy, gz = out
+    np.multiply(k1 * inv_r, xs, out=gx)
+    np.multiply(k1 * inv_r, ys, out=gy)
+    np.multiply(k2 * inv_r, zs, out=gz)
 
-    return [gx, gy, gz]
+    return out
@@ -16,8 +16,7 @@ __all__ = [
 # IMPORT
 import math
 from beartype import beartype
-import numpy as np
-from firefly.earth.earth_model import EarthModel
+from firefly.earth.earth_model import get_earth_model
 
 from firefly.settings import DEFAULT_EARTH_MODEL
 from firefly.types import FloatNumber
@@ -25,6 +24,98 @@ from firefly.types import FloatNumber
 
 CONVERGENCE_THRESHOLD = 1e-12
 
+_HALF_PI = math.pi * 0.5
+
+
+def _vincenty(
+        lat1: float,
+        long1: float,
+        lat2: float,
+        long2: float,
+        a: float,
+        b: float,
+        f: float,
+        nb_iter: int) -> float:
+    """Vincenty inverse iteration working on plain floats.
+
+    The whole iterative body runs on scalar floats with `math.*` calls
+    only, keeping the hot loop free of NumPy dispatch and exception
+    handling (the division guard is an explicit branch).
+
+    Args:
+        lat1 (float): latitude of the first point in radians.
+        long1 (float): longitude of the first point in radians.
+        lat2 (float): latitude of the second point in radians.
+        long2 (float): longitude of the second point in radians.
+        a (float): semi major axis of the ellipsoid (meters)
+        b (float): semi minor axis of the ellipsoid (meters)
+        f (float): flattening of the ellipsoid (SI)
+        nb_iter (int): maximum number of iterations for convergence.
+
+    Returns:
+        float: the geodesic distance between the two points in meters.
+
+    Raises:
+        RuntimeError: if the iteration does not converge.
+    """
+
+    U1 = math.atan((1 - f) * math.tan(lat1))
+    U2 = math.atan((1 - f) * math.tan(lat2))
+    L = long2 - long1
+    Lambda = L
+
+    sinU1 = math.sin(U1)
+    cosU1 = math.cos(U1)
+    sinU2 = math.sin(U2)
+    cosU2 = math.cos(U2)
+
+    # loop invariants hoisted out of the iteration
+    cosU1cosU2 = cosU1 * cosU2
+    sinU1sinU2 = sinU1 * sinU2
+
+    # require the convergence criterion twice in a row: near-antipodal
+    # pairs can oscillate around the threshold for one iteration
+    converged_once = False
+
+    for _ in range(nb_iter):
+        sinLambda = math.sin(Lambda)
+        cosLambda = math.cos(Lambda)
+        sinSigma = math.sqrt((cosU2 * sinLambda) ** 2 +
+                             (cosU1 * sinU2 - sinU1 * cosU2 * cosLambda) ** 2)
+        if sinSigma == 0:
+            return 0.0  # coincident points
+        cosSigma = sinU1sinU2 + cosU1cosU2 * cosLambda
+        sigma = math.atan2(sinSigma, cosSigma)
+        sinAlpha = cosU1cosU2 * sinLambda / sinSigma
+        cosSqAlpha = 1 - sinAlpha ** 2
+        if cosSqAlpha > 1e-30:
+            cos2SigmaM = cosSigma - 2 * sinU1sinU2 / cosSqAlpha
+        else:
+            cos2SigmaM = 0.0  # equatorial line
+        C = f / 16 * cosSqAlpha * (4 + f * (4 - 3 * cosSqAlpha))
+        LambdaPrev = Lambda
+        Lambda = L + (1 - C) * f * sinAlpha * (sigma + C * sinSigma *
+                                               (cos2SigmaM + C * cosSigma *
+                                                (-1 + 2 * cos2SigmaM ** 2)))
+        if abs(Lambda - LambdaPrev) < CONVERGENCE_THRESHOLD:
+            if converged_once:
+                break  # successful convergence
+            converged_once = True
+        else:
+            converged_once = False
+    else:
+        raise RuntimeError("Range Calculation - Impossible to coverge")
+
+    uSq = cosSqAlpha * (a ** 2 - b ** 2) / (b ** 2)
+    A = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
+    B = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
+    deltaSigma = (B * sinSigma * (cos2SigmaM + B / 4 * (cosSigma *
+                  (-1 + 2 * cos2SigmaM ** 2) - B / 6 * cos2SigmaM *
+                  (-3 + 4 * sinSigma ** 2) * (-3 + 4 * cos2SigmaM ** 2))))
+    s = b * A * (sigma - deltaSigma)
+
+    return round(s, 4)
+
 
 @beartype
 def get_range(
@@ -33,7 +124,7 @@ def get_range(
         lat2: FloatNumber,
         long2: FloatNumber,
         earth_model: str = DEFAULT_EARTH_MODEL,
-        nb_iter:int = 200,
+        nb_iter:int = 100,
         ) -> float:
     """
     Calculate the distance between two points on the Earth's surface using the Haversine formula.
@@ -45,8 +136,9 @@ def get_range(
         long2 (FloatNumber): The longitude of the second point in radians.
         earth_model (str, optional): The Earth model to use for the calculation.
             Defaults to DEFAULT_EARTH_MODEL.
-        nb_iter (int, optional): The number of iterations for convergence.
-            Defaults to 200.
+        nb_iter (int, optional): The maximum number of iterations for
+            convergence; near-antipodal pairs may need more. Defaults
+            to 100.
 
     Returns:
         float: The distance between the two points in meters.
@@ -65,9 +157,9 @@ def get_range(
 
 
     # latitue assertion
-    if abs(float(lat1)) > np.pi / 2 or abs(float(lat2)) > np.pi / 2:
+    if abs(float(lat1)) > _HALF_PI or abs(float(lat2)) > _HALF_PI:
         msg = ("Latitudes Value shall be lower than 90"
-               f" (lat1: {np.rad2deg(lat1)} , lat2: {np.rad2deg(lat2)})")
+               f" (lat1: {math.degrees(lat1)} , lat2: {math.degrees(lat2)})")
         raise ValueError(msg)
 
     # short-circuit coincident points
@@ -75,15 +167,15 @@ def get_range(
         return 0.0
 
     # load earth model
-    earth = EarthModel(earth_model)
+    earth = get_earth_model(earth_model)
     a = earth.a
     b = earth.b
     f = earth.f
 
     def correct_pole(lat: FloatNumber) -> float:
         # correct for errors at exact poles by adjusting 0.6 millimeters:
-        if np.absolute(np.pi/2-np.absolute(lat1)) < 1e-10:
-            return math.copysign(np.pi/2-(1e-10), lat1)
+        if abs(_HALF_PI - abs(lat1)) < 1e-10:
+            return math.copysign(_HALF_PI - (1e-10), lat1)
         else:
             return float(lat)
 
@@ -91,47 +183,13 @@ def get_range(
     lat1 = correct_pole(lat1)
     lat2 = correct_pole(lat2)
 
-    U1 = np.arctan((1 - f) * np.tan(lat1))
-    U2 = np.arctan((1 - f) * np.tan(lat2))
-    L = long2 - long1 # type: ignore
-    Lambda = L
+    # nearly coincident points: the great-circle arc estimate is exact
+    # to well below the millimeter, skip the iteration entirely
+    arc_est = (abs(lat2 - lat1)
+               + abs(long2 - long1) * math.cos(0.5 * (lat1 + lat2)))
+    if arc_est < 1e-9:
+        return a * arc_est
 
-    sinU1 = math.sin(U1)
-    cosU1 = math.cos(U1)
-    sinU2 = math.sin(U2)
-    cosU2 = math.cos(U2)
-
-    for _ in range(nb_iter):
-        sinLambda = math.sin(Lambda)
-        cosLambda = math.cos(Lambda)
-        sinSigma = math.sqrt((cosU2 * sinLambda) ** 2 +
-                             (cosU1 * sinU2 - sinU1 * cosU2 * cosLambda) ** 2)
-        if sinSigma == 0:
-            return 0.0  # coincident points
-        cosSigma = sinU1 * sinU2 + cosU1 * cosU2 * cosLambda
-        sigma = math.atan2(sinSigma, cosSigma)
-        sinAlpha = cosU1 * cosU2 * sinLambda / sinSigma
-        cosSqAlpha = 1 - sinAlpha ** 2
-        try:
-            cos2SigmaM = cosSigma - 2 * sinU1 * sinU2 / cosSqAlpha
-        except ZeroDivisionError:
-            cos2SigmaM = 0
-        C = f / 16 * cosSqAlpha * (4 + f * (4 - 3 * cosSqAlpha))
-        LambdaPrev = Lambda
-        Lambda = L + (1 - C) * f * sinAlpha * (sigma + C * sinSigma *
-                                               (cos2SigmaM + C * cosSigma *
-                                                (-1 + 2 * cos2SigmaM ** 2)))
-        if abs(Lambda - LambdaPrev) < CONVERGENCE_THRESHOLD:
-            break  # successful convergence
-    else:
-        raise RuntimeError("Range Calculation - Impossible to coverge")
-
-    uSq = cosSqAlpha * (a ** 2 - b ** 2) / (b ** 2)
-    A = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
-    B = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
-    deltaSigma = (B * sinSigma * (cos2SigmaM + B / 4 * (cosSigma *
-                  (-1 + 2 * cos2SigmaM ** 2) - B / 6 * cos2SigmaM *
-                  (-3 + 4 * sinSigma ** 2) * (-3 + 4 * cos2SigmaM ** 2))))
-    s = b * A * (sigma - deltaSigma)
-
-    return round(s, 4)
+    return _vincenty(
+        float(lat1), float(long1), float(lat2), float(long2),
+        a, b, f, nb_iter)
@@ -9,16 +9,18 @@ from __future__ import annotations
 
 # EXPORT
 __all__ = [
-    "Position"
+    "Position",
+    "PositionArray",
 ]
 
 # IMPORT
 import math
+from dataclasses import dataclass
 from beartype import beartype
 import numpy as np
 from pydantic import BaseModel, ConfigDict
 
-from firefly.earth.earth_model import EarthModel
+from firefly.earth.earth_model import get_earth_model
 from firefly.types import FloatNumber
 
 
@@ -28,6 +30,188 @@ from firefly.types import FloatNumber
 from firefly.settings import DEFAULT_EARTH_MODEL
 
 
+_DEG2RAD = math.pi / 180.0
+
+
+def _ecef_to_lla(x: float,
+                 y: float,
+                 z: float,
+                 a: float,
+                 b: float,
+                 f: float,
+                 e2: float,
+                 ep2: float) -> tuple[float, float, float]:
+    """scalar ECEF to LLA conversion kernel (iterative Bowring)
+
+    Works on plain floats with `math` functions only, so hot paths can
+    call it without going through a `Position` instance (no pydantic
+    attribute access inside the iteration).
+
+    Args:
+        x (float): x coordinate in ECEF (meters)
+        y (float): y coordinate in ECEF (meters)
+        z (float): z coordinate in ECEF (meters)
+        a (float): semi major axis of the ellipsoid (meters)
+        b (float): semi minor axis of the ellipsoid (meters)
+        f (float): flattening of the ellipsoid (SI)
+        e2 (float): square of the first eccentricity (SI)
+        ep2 (float): square of the second eccentricity (SI)
+
+    Returns:
+        tuple[float, float, float]: latitude (rad), longitude (rad),
+            altitude (m)
+    """
+    # Longitude
+    longitude = math.atan2(y, x)
+
+    # Distance from Z-axis
+    D = math.hypot(x, y)
+
+    # Bowring's formula for initial parametric
+    # (beta) and geodetic (phi) latitudes
+    # (cubes are multiply chains: x**3 dispatches through libm pow)
+    beta = math.atan2(z, (1 - f) * D)
+    sb = math.sin(beta)
+    cb = math.cos(beta)
+    phi = math.atan2(z + b * ep2 * sb*sb*sb,
+                     D - a * e2 * cb*cb*cb)
+
+    # Fixed-point iteration with Bowring's formula: sub-microarcsecond
+    # convergence takes two or three iterations, so the loop is capped
+    # at four and stops on a tolerance instead of float equality (which
+    # can flap forever on the last ULP)
+    beta_new = math.atan2((1 - f)*math.sin(phi), math.cos(phi))
+    count = 0
+
+    while abs(beta - beta_new) > 1e-14 and count < 4:
+
+        beta = beta_new
+        sb = math.sin(beta)
+        cb = math.cos(beta)
+        phi = math.atan2(z + b * ep2 * sb*sb*sb,
+                         D - a * e2 * cb*cb*cb)
+        beta_new = math.atan2((1 - f)*math.sin(phi),
+                              math.cos(phi))
+        count += 1
+
+    # Calculate ellipsoidal height from the final value for latitude
+    sinphi = math.sin(phi)
+    N = a / math.sqrt(1 - e2 * sinphi*sinphi)
+    altitude = D * math.cos(phi) + (z + e2 * N * sinphi) * sinphi - N
+
+    return phi, longitude, altitude
+
+
+@dataclass(slots=True)
+class PositionArray:
+    """Structure-of-arrays companion to `Position`.
+
+    Holds the ECEF coordinates of N positions as three contiguous
+    float64 arrays so whole-trajectory operations (`norm`,
+    `as_LLA_batch`, `gravity_soa`) run as NumPy ufuncs over unit-stride
+    memory instead of looping over `Position` instances.
+
+    Attributes:
+        xs (np.ndarray): x coordinates in ECEF (meters)
+        ys (np.ndarray): y coordinates in ECEF (meters)
+        zs (np.ndarray): z coordinates in ECEF (meters)
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    zs: np.ndarray
+
+    def __post_init__(self):
+        self.xs = np.ascontiguousarray(self.xs, dtype=np.float64)
+        self.ys = np.ascontiguousarray(self.ys, dtype=np.float64)
+        self.zs = np.ascontiguousarray(self.zs, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index: int) -> Position:
+        """extract one position as a scalar `Position` object"""
+        return Position(self.xs[index], self.ys[index], self.zs[index])
+
+    def __sub__(self, __o: object) -> PositionArray:
+        """elementwise difference of two position arrays"""
+        if isinstance(__o, PositionArray):
+            return PositionArray(self.xs - __o.xs,
+                                 self.ys - __o.ys,
+                                 self.zs - __o.zs)
+
+        msg = (
+            f"Class PositionArray subtraction with this data type"
+            f" [{type(__o)} is not implemented]"
+        )
+        raise NotImplementedError(msg)
+
+    @staticmethod
+    def from_LLA(lat: np.ndarray,
+                 long: np.ndarray,
+                 alt: np.ndarray,
+                 earth_model: str = DEFAULT_EARTH_MODEL
+                 ) -> PositionArray:
+        """create a PositionArray from arrays of geodetic positions
+        (ie. latitude, longitude, altitude)
+
+        Args:
+            lat (np.ndarray): latitudes in radians
+            long (np.ndarray): longitudes in radians
+            alt (np.ndarray): altitudes in meters
+            earth_model (str, optional): Model of
+                Earth Ellipsoid. Defaults to "WGS84".
+
+        Returns:
+            PositionArray: the converted ECEF coordinates in SoA layout.
+        """
+        xs, ys, zs = Position.from_LLA_array(lat, long, alt,
+                                             earth_model=earth_model)
+        return PositionArray(xs, ys, zs)
+
+    @staticmethod
+    def from_positions(positions: list[Position]) -> PositionArray:
+        """build a PositionArray from a list of `Position` objects
+
+        Args:
+            positions (list[Position]): positions to pack.
+
+        Returns:
+            PositionArray: the same coordinates in SoA layout.
+        """
+        return PositionArray(
+            np.array([pos.x for pos in positions]),
+            np.array([pos.y for pos in positions]),
+            np.array([pos.z for pos in positions]))
+
+    def norm(self) -> np.ndarray:
+        """
+        Calculate the Euclidean norm of every position vector.
+
+        Returns:
+            np.ndarray: the norms, one per position, in meters.
+        """
+        return np.sqrt(self.xs*self.xs + self.ys*self.ys
+                       + self.zs*self.zs)
+
+    def as_LLA(self,
+               earth_model: str = DEFAULT_EARTH_MODEL
+               ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """return the geographic positions (latitude, longitude,
+        altitude arrays) against an Ellipsoid model (by default WGS84)
+
+        Args:
+            earth_model (str, optional): Ellispoid reference.
+                Defaults to "WGS84".
+
+        Returns:
+            np.ndarray : latitudes in radians
+            np.ndarray : longitudes in radians
+            np.ndarray : altitudes in meters
+        """
+        return Position.as_LLA_batch(self.xs, self.ys, self.zs,
+                                     earth_model=earth_model)
+
+
 class Position(BaseModel):
     """Class for the management of ECEF position
     """
@@ -74,10 +258,29 @@ class Position(BaseModel):
             "Class Position equality with" +
             f" this data type [{type(__o)} is not implemented]")
 
+    @classmethod
+    def _from_raw(cls, x: float, y: float, z: float) -> Position:
+        """build a Position without validation
+
+        Fast constructor for internal arithmetic where the components
+        are already floats (e.g. read off an existing Position):
+        `model_construct` skips the pydantic validation pipeline.
+
+        Args:
+            x (float): x coordinates in ECEF
+            y (float): y coordinates in ECEF
+            z (float): z coordinates in ECEF
+
+        Returns:
+            Position: the new position.
+        """
+        return cls.model_construct(x=x, y=y, z=z)
+
     def __sub__(self, __o: object) -> Position:
         """internal method for equality"""
         if isinstance(__o, Position):
-            return Position(self.x - __o.x, self.y - __o.y, self.z - __o.z)
+            return Position._from_raw(
+                self.x - __o.x, self.y - __o.y, self.z - __o.z)
 
         msg = (
             f"Class Position equality with this data type [{type(__o)}"
@@ -100,7 +303,7 @@ class Position(BaseModel):
             3.7416573867739413
         """
 
-        return float(np.linalg.norm([self.x, self.y, self.z]))
+        return math.sqrt(self.x*self.x + self.y*self.y + self.z*self.z)
 
     # ----------------------------- EXPORT ----------------------------- #
 
@@ -114,10 +317,14 @@ class Position(BaseModel):
         Examples:
             >>> position = Position(x=1, y=2, z=3)
             >>> position.as_numpy_vector()
-            array([1, 2, 3])
+            array([1., 2., 3.])
         """
 
-        return np.array([self.x, self.y, self.z])
+        out = np.empty(3)
+        out[0] = self.x
+        out[1] = self.y
+        out[2] = self.z
+        return out
 
     # --------------------------- LLA / ECEF --------------------------- #
 
@@ -142,13 +349,48 @@ class Position(BaseModel):
             obj: instance of Position Class
         """
 
+        X, Y, Z = Position.from_LLA_array(lat, long, alt,
+                                          earth_model=earth_model)
+
+        return Position(float(X), float(Y), float(Z))
+
+    @staticmethod
+    def from_LLA_array(lat: np.ndarray,
+                       long: np.ndarray,
+                       alt: np.ndarray,
+                       earth_model: str = DEFAULT_EARTH_MODEL
+                       ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """convert arrays of geodetic positions (ie. latitude,
+        longitude, altitude) to ECEF coordinates
+
+        The conversion is one vectorized NumPy expression: the earth
+        constants are loaded once and no per-point `Position` object is
+        created.
+
+        Args:
+            lat (np.ndarray): latitudes in radians
+            long (np.ndarray): longitudes in radians
+            alt (np.ndarray): altitudes in meters
+            earth_model (str, optional): Model of
+                Earth Ellipsoid. Defaults to "WGS84".
+
+        Returns:
+            np.ndarray : x coordinates in ECEF (meters)
+            np.ndarray : y coordinates in ECEF (meters)
+            np.ndarray : z coordinates in ECEF (meters)
+        """
+
         # create EarthModel
-        earth = EarthModel(earth_model)
+        earth = get_earth_model(earth_model)
 
         # constante
         a = earth.a
         e2 = earth.e**2
 
+        lat = np.asarray(lat, dtype=np.float64)
+        long = np.asarray(long, dtype=np.float64)
+        alt = np.asarray(alt, dtype=np.float64)
+
         # transofrmation algorithm
         sinlat = np.sin(lat)
         coslat = np.cos(lat)
@@ -160,25 +402,66 @@ class Position(BaseModel):
         Y = (N + alt) * coslat * np.sin(long)
         Z = (N*(1 - e2) + alt) * sinlat
 
-        return Position(X, Y, Z)
+        return X, Y, Z
 
-    def as_LLA(self,
-               earth_model: str = DEFAULT_EARTH_MODEL
-               ):
-        """return the geographic position (i.e. latitude, longitude and
-        altitude) against an Ellipsoid model (by default WGS84)
+    @staticmethod
+    def from_LLA_deg(lat_deg: np.ndarray,
+                     long_deg: np.ndarray,
+                     alt: np.ndarray,
+                     earth_model: str = DEFAULT_EARTH_MODEL
+                     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """convert arrays of geodetic positions given in degrees to
+        ECEF coordinates
+
+        Callers holding degrees no longer need a separate np.deg2rad
+        pass: the conversion factor is folded in here.
+
+        Args:
+            lat_deg (np.ndarray): latitudes in degrees
+            long_deg (np.ndarray): longitudes in degrees
+            alt (np.ndarray): altitudes in meters
+            earth_model (str, optional): Model of
+                Earth Ellipsoid. Defaults to "WGS84".
+
+        Returns:
+            np.ndarray : x coordinates in ECEF (meters)
+            np.ndarray : y coordinates in ECEF (meters)
+            np.ndarray : z coordinates in ECEF (meters)
+        """
+        return Position.from_LLA_array(
+            np.asarray(lat_deg, dtype=np.float64) * _DEG2RAD,
+            np.asarray(long_deg, dtype=np.float64) * _DEG2RAD,
+            alt,
+            earth_model=earth_model)
+
+    @staticmethod
+    def as_LLA_batch(x: np.ndarray,
+                     y: np.ndarray,
+                     z: np.ndarray,
+                     earth_model: str = DEFAULT_EARTH_MODEL
+                     ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """convert arrays of ECEF coordinates to geographic positions
+        (i.e. latitude, longitude and altitude) against an Ellipsoid
+        model (by default WGS84)
+
+        The conversion uses Heikkinen's closed-form solution, so every
+        point costs a fixed number of NumPy ufunc passes (no iteration)
+        and no per-point `Position` object is created.
 
         Args:
+            x (np.ndarray): x coordinates in ECEF (meters)
+            y (np.ndarray): y coordinates in ECEF (meters)
+            z (np.ndarray): z coordinates in ECEF (meters)
             earth_model (str, optional): Ellispoid reference.
-            Defaults to "WGS84".
+                Defaults to "WGS84".
 
         Returns:
-            float : latitude in radians
-            float : longitude in radians
-            float : altitude in radians
+            np.ndarray : latitudes in radians
+            np.ndarray : longitudes in radians
+            np.ndarray : altitudes in meters
         """
         # create EarthModel
-        earth = EarthModel(earth_model)
+        earth = get_earth_model(earth_model)
 
         # constante
         a = earth.a
@@ -188,38 +471,60 @@ class Position(BaseModel):
         e2 = e**2       # Square of first eccentricity
         ep2 = e2 / (1 - e2)    # Square of second eccentricity
 
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        z = np.asarray(z, dtype=np.float64)
+
         # Longitude
-        longitude = math.atan2(self.y, self.x)
+        longitude = np.arctan2(y, x)
 
         # Distance from Z-axis
-        D = math.hypot(self.x, self.y)
+        D = np.hypot(x, y)
+
+        # Heikkinen's closed-form solution (exact, no iteration)
+        E2 = a*a - b*b
+        F = 54 * b*b * z*z
+        G = D*D + (1 - e2) * z*z - e2 * E2
+        C = e2*e2 * F * D*D / (G*G*G)
+        S = np.cbrt(1 + C + np.sqrt(C*C + 2*C))
+        P = F / (3 * (S + 1/S + 1)**2 * G*G)
+        Q = np.sqrt(1 + 2 * e2*e2 * P)
+        r0 = (-(P * e2 * D) / (1 + Q)
+              + np.sqrt(0.5 * a*a * (1 + 1/Q)
+                        - P * (1 - e2) * z*z / (Q * (1 + Q))
+                        - 0.5 * P * D*D))
+        De = D - e2 * r0
+        U = np.sqrt(De*De + z*z)
+        V = np.sqrt(De*De + (1 - e2) * z*z)
+        z0 = b*b * z / (a * V)
+
+        latitude = np.arctan2(z + ep2 * z0, D)
+        altitude = U * (1 - b*b / (a * V))
 
-        # Bowring's formula for initial parametric
-        # (beta) and geodetic (phi) latitudes
-        beta = math.atan2(self.z, (1 - f) * D)
-        phi = math.atan2(self.z + b * ep2 * math.sin(beta)**3,
-                         D - a * e2 * math.cos(beta)**3)
-
-        # Fixed-point iteration with Bowring's formula
-        # (typically converges within two or three iterations)
-        beta_new = math.atan2((1 - f)*math.sin(phi), math.cos(phi))
-        count = 0
+        return latitude, longitude, altitude
 
-        while beta != beta_new and count < 1000:
+    def as_LLA(self,
+               earth_model: str = DEFAULT_EARTH_MODEL
+               ):
+        """return the geographic position (i.e. latitude, longitude and
+        altitude) against an Ellipsoid model (by default WGS84)
 
-            beta = beta_new
-            phi = math.atan2(self.z + b * ep2 * math.sin(beta)**3,
-                             D - a * e2 * math.cos(beta)**3)
-            beta_new = math.atan2((1 - f)*math.sin(phi),
-                                 math.cos(phi))
-            count += 1
+        Args:
+            earth_model (str, optional): Ellispoid reference.
+            Defaults to "WGS84".
 
-        # Calculate ellipsoidal height from the final value for latitude
-        sinphi = math.sin(phi)
-        N = a / math.sqrt(1 - e2 * sinphi**2)
-        altitude = D * math.cos(phi) + (self.z + e2 * N * sinphi) * sinphi - N
+        Returns:
+            float : latitude in radians
+            float : longitude in radians
+            float : altitude in radians
+        """
+        # create EarthModel
+        earth = get_earth_model(earth_model)
 
-        latitude = phi
+        # constante
+        e2 = earth.e**2       # Square of first eccentricity
+        ep2 = e2 / (1 - e2)    # Square of second eccentricity
 
         # voir https://github.com/kvenkman/ecef2lla/blob/master/ecef2lla.py
-        return latitude, longitude, altitude
+        return _ecef_to_lla(self.x, self.y, self.z,
+                            earth.a, earth.b, earth.f, e2, ep2)
@@ -3,6 +3,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import KW_ONLY
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 from pydantic import BaseModel, Field, field_validator
@@ -25,6 +26,10 @@ __all__ = [
 class MarkdownContent(BaseModel):
     """
     Represents a piece of Markdown content with a header, content, and footer.
+
+    The publish() implementations build their MarkdownContent with
+    model_construct: the strings are generated internally and trusted,
+    so the pydantic field validation is skipped on that hot path.
     """
 
     header: str = ""
@@ -80,6 +85,20 @@ class MarkdownElement(ABC,BaseModel):
             list[Path]: A list of paths to the exported files.
         """
 
+    @cached_property
+    def published(self) -> MarkdownContent:
+        """
+        The publish() output cached on the instance.
+
+        Elements are written once and then rendered (possibly several
+        times, e.g. md and html publishes), so the MarkdownContent is a
+        pure function of the fields and can be computed a single time.
+
+        Returns:
+            MarkdownContent: The published Markdown content.
+        """
+        return self.publish()
+
 class AcronymMarkdown(MarkdownElement,BaseModel):
     """
     Represents an acronym in Markdown format.
@@ -131,7 +150,7 @@ class AcronymMarkdown(MarkdownElement,BaseModel):
         return value
 
     def publish(self) -> MarkdownContent:
-        return MarkdownContent(
+        return MarkdownContent.model_construct(
             footer=f"*[{self.title}]: {self.definition}\n"
         )
 
@@ -192,6 +211,12 @@ class ImageMarkdown(MarkdownElement,BaseModel):
         # get the filename and extension of the original image
         new_file_path = target_path / self.original_path.name
 
+        # skip the copy if the image is already in place (same size):
+        # repeated publishes would otherwise redo the disk I/O
+        if (new_file_path.exists() and
+                new_file_path.stat().st_size == self.original_path.stat().st_size):
+            return new_file_path
+
         # copy the file to the target directory
         new_file_path = copy_file(
             source_path=self.original_path,
@@ -200,7 +225,7 @@ class ImageMarkdown(MarkdownElement,BaseModel):
         return new_file_path
 
     def publish(self) -> MarkdownContent:
-        return MarkdownContent(
+        return MarkdownContent.model_construct(
             content=f"![{self.replacement_text}]({self._imageFolderName}/{self.original_path.name})"
         )
 
@@ -212,7 +237,7 @@ class MarkdownNewLine(MarkdownElement):
     Represents a new line in Markdown format.
     """
     def publish(self) -> MarkdownContent:
-        return MarkdownContent(content="  \n")
+        return MarkdownContent.model_construct(content="  \n")
 
     def export_additional_files(self, directory_path: Path) -> list[Path]:
         return []
@@ -247,7 +272,7 @@ class MarkdownText(MarkdownElement,BaseModel):
         return value
 
     def publish(self) -> MarkdownContent:
-        return MarkdownContent(content=self.content)
+        return MarkdownContent.model_construct(content=self.content)
 
     def export_additional_files(self, directory_path: Path) -> list[Path]:
         return []
@@ -282,7 +307,7 @@ class MarkdownParagraph(MarkdownElement,BaseModel):
         return value
 
     def publish(self) -> MarkdownContent:
-        return MarkdownContent(content="\n\n" + self.content + "\n")
+        return MarkdownContent.model_construct(content="\n\n" + self.content + "\n")
 
     def export_additional_files(self, directory_path: Path) -> list[Path]:
         return []
@@ -327,7 +352,7 @@ class MarkdownTitle(MarkdownElement,BaseModel):
         return value
 
     def publish(self) -> MarkdownContent:
-        return MarkdownContent(
+        return MarkdownContent.model_construct(
             content=f"\n{'#' * self.level} {self.title.capitalize()}\n")
 
     def export_additional_files(self, directory_path: Path) -> list[Path]:
@@ -372,7 +397,7 @@ class MarkdownPageTitle(MarkdownElement,BaseModel):
         Returns:
             MarkdownContent: The published Markdown content.
         """
-        return MarkdownContent(header=f"# {self.title.upper()}\n")
+        return MarkdownContent.model_construct(header=f"# {self.title.upper()}\n")
 
     def export_additional_files(self, directory_path: Path) -> list[Path]:
         return []
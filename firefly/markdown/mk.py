@@ -6,9 +6,10 @@ This module provides a MarkdownText class for working with Markdown content.
 # https://python-markdown.github.io/
 
 
+from itertools import chain
 from pathlib import Path
 import markdown
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from firefly.markdown.elements import (MarkdownElement, MarkdownContent, AcronymMarkdown,
                                        ImageMarkdown, MarkdownPageTitle, MarkdownTitle,
@@ -39,10 +40,17 @@ class MarkdownDocument(BaseModel):
     """
     elements:list[MarkdownElement] = []
 
+    # rendered output cached between publishes; reset whenever the
+    # element list changes
+    _md_cache: str | None = PrivateAttr(default=None)
+    _html_cache: str | None = PrivateAttr(default=None)
+
     def __add__(self, other: "MarkdownDocument") -> "MarkdownDocument":
         if not isinstance(other, MarkdownDocument):
             raise TypeError("Only a MarkdownDocument can be added to another MarkdownDocument.")
         self.elements.extend(other.elements)
+        self._md_cache = None
+        self._html_cache = None
         return self
 
     def add_element(self, element: MarkdownElement) -> None:
@@ -56,6 +64,8 @@ class MarkdownDocument(BaseModel):
             None
         """
         self.elements.append(element)
+        self._md_cache = None
+        self._html_cache = None
 
     def to_md(self) -> str:
         """
@@ -64,11 +74,24 @@ class MarkdownDocument(BaseModel):
         Returns:
             str: The Markdown string.
         """
-        content = MarkdownContent()
+        if self._md_cache is not None:
+            return self._md_cache
+
+        # accumulate the fragments in lists and join once: repeated
+        # MarkdownContent.__add__ copies the whole document per element
+        header = ""
+        contents: list[str] = []
+        footers: list[str] = []
+
         for element in self.elements:
-            element_content = element.publish()
-            content += element_content
-        return str(content)
+            element_content = element.published
+            if element_content.header:
+                header = element_content.header  # last non-empty wins
+            contents.append(element_content.content)
+            footers.append(element_content.footer)
+
+        self._md_cache = f"{header}\n\n{''.join(contents)}\n\n{''.join(footers)}"
+        return self._md_cache
 
     def to_html(self) -> str:
         """
@@ -77,8 +100,11 @@ class MarkdownDocument(BaseModel):
         Returns:
             str: The HTML string.
         """
-        md_data = self.to_md()
-        return markdown.markdown(md_data, extensions=["abbr", "tables"])
+        if self._html_cache is None:
+            md_data = self.to_md()
+            self._html_cache = markdown.markdown(
+                md_data, extensions=["abbr", "tables"])
+        return self._html_cache
 
     def export_additional_files(self, directory_path: Path) -> list[Path]:
         """
@@ -88,12 +114,16 @@ class MarkdownDocument(BaseModel):
             directory_path (Path): The directory path where the additional files will be exported.
 
         Returns:
-            list[Path]: The list of exported file paths.
+            list[Path]: The list of exported file paths, without
+                duplicates.
         """
-        file_paths : list[Path] = []
-        for element in self.elements:
-            file_paths += element.export_additional_files(directory_path)
-        return file_paths
+        # flatten in one pass and drop duplicates while keeping the
+        # element order: the same image used by several elements ends up
+        # at the same destination path and only needs one copy
+        file_paths = chain.from_iterable(
+            element.export_additional_files(directory_path)
+            for element in self.elements)
+        return list(dict.fromkeys(file_paths))
 
     def publish_md_file(
             self,
@@ -158,6 +188,54 @@ class MarkdownDocument(BaseModel):
         _ = self.export_additional_files(file_path.parent)
 
 
+    def publish_both(
+            self,
+            *,
+            md_file_path: Path,
+            html_file_path: Path,
+            exist_ok: bool = False) -> None:
+        """
+        Publishes the document as a Markdown and an HTML file in one
+        pass.
+
+        The Markdown assembly is performed once (to_html reuses the
+        cached Markdown string) and the additional files are exported a
+        single time, instead of once per publish.
+
+        Args:
+            md_file_path (Path): The path to the markdown file.
+            html_file_path (Path): The path where the HTML file will be
+                written.
+            exist_ok (bool, optional): If True, overwrite the files if
+                they already exist. Defaults to False.
+        """
+        # validate file paths
+        md_file_path = validate_file_extension(
+            file_path=md_file_path,
+            extension=[".md"])
+        html_file_path = validate_file_extension(
+            file_path=html_file_path,
+            extension=[".html"])
+
+        # collect the content once; to_html reuses the cached markdown
+        md_data = self.to_md()
+        html_data = self.to_html()
+
+        # write the contents to the files
+        _ = write_string_to_file(
+            file_path=md_file_path,
+            content=md_data,
+            exist_ok=exist_ok)
+        _ = write_string_to_file(
+            file_path=html_file_path,
+            content=html_data,
+            exist_ok=exist_ok)
+
+        # export additional files once per target directory
+        directories = {md_file_path.parent, html_file_path.parent}
+        for directory in directories:
+            _ = self.export_additional_files(directory)
+
     def extract_abbreviation(self) -> list[AcronymMarkdown]:
         """
         Extracts the AcronymMarkdown elements from the document.
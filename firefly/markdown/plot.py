@@ -55,7 +55,7 @@ class PlotMarkdown(MarkdownElement, BaseModel):
         Returns:
             MarkdownContent: The published plot.
         """
-        return MarkdownContent(
+        return MarkdownContent.model_construct(
             content=f"![{self.description}]({self._plot_folder}/{self.filename})"
         )
 
@@ -81,7 +81,7 @@ class MarkdownTable(MarkdownElement, BaseModel):
         Returns:
             MarkdownContent: The content of the published table.
         """
-        return MarkdownContent(
+        return MarkdownContent.model_construct(
             content=f"  \n\n{create_markdown_table(self.columns)}  \n")
 
     def export_additional_files(self, directory_path: Path) -> list[Path]:
@@ -243,6 +243,14 @@ class VariableFlowRate(FlowRate):
         self._interp1d = Interp1D(times_flow_rate, values_flow_rate)
         self.combustion_duration = times_flow_rate[-1]
 
+        # cumulative propellant mass at each node (trapezoidal rule),
+        # so a mass query is a searchsorted plus one partial trapezoid
+        # instead of a full integration pass
+        self._cumulative_mass = np.concatenate((
+            [0.0],
+            np.cumsum(0.5 * (values_flow_rate[:-1] + values_flow_rate[1:])
+                      * np.diff(times_flow_rate))))
+
         # validate the first time value is equal to the start time
         if times_flow_rate[0] != self._START_TIME:
             raise ValueError(f"The first time value must be {self._START_TIME} [s]")
@@ -291,11 +299,19 @@ class VariableFlowRate(FlowRate):
         # validation
         time_since_ignition = self._validate_time(time_since_ignition)
 
-        return (
-            self._interp1d.cummulative_integral(time_since_ignition)
-            if time_since_ignition < self.combustion_duration
-            else self.get_total_propellant_mass()
-        )
+        if time_since_ignition >= self.combustion_duration:
+            return self.get_total_propellant_mass()
+
+        # mass at the last node before the query plus the partial
+        # trapezoid up to the query time
+        times = self._interp1d.x
+        idx = int(np.searchsorted(times, time_since_ignition, side='right')) - 1
+        current_flow_rate = self._interp1d.get_value(time_since_ignition)
+
+        return float(
+            self._cumulative_mass[idx]
+            + 0.5 * (self._interp1d.y[idx] + current_flow_rate)
+            * (time_since_ignition - times[idx]))
 
     def get_total_propellant_mass(self) -> float:
         """Returns the total propellant mass.
@@ -146,6 +146,35 @@ def test_current_parameters_happy_path(test_id, altitude, expected_parameters):
         rel=1e-4)
 
 
+def test_current_parameters_batch():
+    # Arrange
+    ussa76 = USSA76()
+    altitudes = np.array([0., 11000., 25000., 50000., 75000., 90000.])
+
+    # Act
+    temperature, pressure, density, speed_of_sound = \
+        ussa76.current_parameters_batch(altitudes)
+
+    # Assert - each point matches the scalar API
+    for idx, altitude in enumerate(altitudes):
+        expected = ussa76.current_parameters(altitude)
+        assert temperature[idx] == pytest.approx(expected.temperature,
+                                                 rel=1e-6)
+        assert pressure[idx] == pytest.approx(expected.pressure, rel=1e-6)
+        assert density[idx] == pytest.approx(expected.density, rel=1e-6)
+        assert speed_of_sound[idx] == pytest.approx(expected.speed_of_sound,
+                                                    rel=1e-6)
+
+
+def test_current_parameters_batch_negative_altitude():
+    # Arrange
+    ussa76 = USSA76()
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ussa76.current_parameters_batch(np.array([0., -1.]))
+
+
 # Assuming the Atmosphere class has an attribute max_altitude and a private method _invalidate_negative_altitude
 # and an instance variable __with_warnings that controls whether warnings are issued.
 
@@ -3,7 +3,7 @@
 
 # MODULE IMPORT
 from firefly.geography.position import Position
-from firefly.earth.gravity import gravity
+from firefly.earth.gravity import gravity, gravity_many, gravity_soa
 import numpy as np
 
 
@@ -34,4 +34,52 @@ def test_NorthPole_WGS84():
         )
     np.testing.assert_array_almost_equal(
         g_list,
-        g_expected)
\ No newline at end of file
+        g_expected)
+
+def test_gravity_many_matches_scalar():
+
+    positions = [
+        Position.from_LLA(0., 0., 0.),
+        Position.from_LLA(np.deg2rad(90), 0., 0.),
+        Position.from_LLA(np.deg2rad(45), np.deg2rad(-45), 10000.),
+        ]
+
+    xyz = np.array([[pos.x, pos.y, pos.z] for pos in positions])
+
+    g_many = gravity_many(xyz)
+
+    for idx, pos in enumerate(positions):
+        np.testing.assert_allclose(
+            g_many[idx],
+            gravity(position=pos),
+            atol=ABSOLUTE_TOLERANCE,
+            rtol=RELATIVE_TOLERANCE)
+
+
+def test_gravity_many_out_buffer():
+
+    xyz = np.array([[6378137.0, 0., 0.], [0., 0., 6371000.0]])
+    out = np.empty_like(xyz)
+
+    result = gravity_many(xyz, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(out[0], gravity(position=Position(*xyz[0])))
+
+
+def test_gravity_soa_matches_scalar():
+    from firefly.geography.position import PositionArray
+
+    positions = PositionArray.from_positions([
+        Position.from_LLA(0., 0., 0.),
+        Position.from_LLA(np.deg2rad(45), np.deg2rad(-45), 10000.),
+        ])
+
+    gx, gy, gz = gravity_soa(positions.xs, positions.ys, positions.zs)
+
+    for idx in range(len(positions)):
+        np.testing.assert_allclose(
+            [gx[idx], gy[idx], gz[idx]],
+            gravity(position=positions[idx]),
+            atol=ABSOLUTE_TOLERANCE,
+            rtol=RELATIVE_TOLERANCE)
@@ -3,7 +3,7 @@
 """
 
 # MODULE IMPORT
-from firefly.geography.position import Position
+from firefly.geography.position import Position, PositionArray
 import pytest
 import numpy as np
 
@@ -80,6 +80,35 @@ def test_toLLA():
         compare_LLA(LLA_real, pos["LLA"])
 
 
+def test_toLLA_batch():
+
+    # convert all the reference points in a single vectorized call
+    x = np.array([pos["ECEF"][0] for pos in LLA4ECEF])
+    y = np.array([pos["ECEF"][1] for pos in LLA4ECEF])
+    z = np.array([pos["ECEF"][2] for pos in LLA4ECEF])
+
+    lat, long, alt = Position.as_LLA_batch(x, y, z)
+
+    for idx, pos in enumerate(LLA4ECEF):
+        compare_LLA((lat[idx], long[idx], alt[idx]), pos["LLA"])
+
+
+def test_toLLA_batch_vs_scalar():
+    """the batch conversion shall match the scalar `as_LLA` exactly"""
+
+    for pos in LLA4ECEF:
+        expected = Position(*pos["ECEF"]).as_LLA()
+
+        lat, long, alt = Position.as_LLA_batch(
+            np.array([pos["ECEF"][0]]),
+            np.array([pos["ECEF"][1]]),
+            np.array([pos["ECEF"][2]]))
+
+        compare_LLA(
+            (lat[0], long[0], alt[0]),
+            (np.rad2deg(expected[0]), np.rad2deg(expected[1]), expected[2]))
+
+
 def test_FromLLA():
     for pos in LLA4ECEF:
         newPos = Position.from_LLA(
@@ -188,3 +217,50 @@ def compare_LLA(LLA_real,
             LLA_expected[idx],
             abs=absTol,
             rel=reltol), message
+
+
+def test_position_array():
+    positions = [Position(*pos["ECEF"]) for pos in LLA4ECEF]
+    pos_array = PositionArray.from_positions(positions)
+
+    assert len(pos_array) == 2
+    assert pos_array[1] == positions[1]
+    np.testing.assert_allclose(
+        pos_array.norm(),
+        [positions[0].norm, positions[1].norm])
+
+    lats, longs, alts = pos_array.as_LLA()
+    for idx, pos in enumerate(positions):
+        np.testing.assert_allclose(
+            (lats[idx], longs[idx], alts[idx]),
+            pos.as_LLA())
+
+
+def test_FromLLA_array():
+
+    lat = np.deg2rad([pos["LLA"][0] for pos in LLA4ECEF])
+    long = np.deg2rad([pos["LLA"][1] for pos in LLA4ECEF])
+    alt = np.array([pos["LLA"][2] for pos in LLA4ECEF])
+
+    x, y, z = Position.from_LLA_array(lat, long, alt)
+
+    for idx, pos in enumerate(LLA4ECEF):
+        compare_ECEF(Position(x[idx], y[idx], z[idx]), pos["ECEF"])
+
+
+def test_position_array_from_LLA_and_sub():
+
+    lat = np.deg2rad([pos["LLA"][0] for pos in LLA4ECEF])
+    long = np.deg2rad([pos["LLA"][1] for pos in LLA4ECEF])
+    alt = np.array([pos["LLA"][2] for pos in LLA4ECEF])
+
+    pos_array = PositionArray.from_LLA(lat, long, alt)
+
+    for idx, pos in enumerate(LLA4ECEF):
+        compare_ECEF(pos_array[idx], pos["ECEF"])
+
+    delta = pos_array - pos_array
+    np.testing.assert_array_equal(delta.xs, np.zeros(len(pos_array)))
+
+    with pytest.raises(NotImplementedError):
+        pos_array - 1